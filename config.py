@@ -26,6 +26,14 @@ class Config:
     # Ground sensor (downward-facing for potholes/curbs/stairs)
     GROUND_SENSOR = {'trigger': 10, 'echo': 9}
     
+    # Sensors pointing in different directions can ping simultaneously
+    # without picking up each other's echoes
+    SENSOR_GROUPS = [
+        ['front_center', 'left_side', 'right_side', 'ground_sensor'],
+        ['front_high'],
+        ['front_low']
+    ]
+    
     # ========== HAPTIC MOTOR GPIO PINS (BCM numbering) ==========
     HAPTIC_MOTORS = {
         'front_upper': 12,    # Upper chest motor (overhead obstacles)
@@ -34,16 +42,26 @@ class Config:
         'left': 21,           # Left shoulder motor (left-side obstacles)
         'right': 26           # Right shoulder motor (right-side obstacles)
     }
+    HAPTIC_TICK_INTERVAL = 0.01  # Vibration pattern resolution (seconds)
     
     # ========== DATA LOGGING SETTINGS ==========
     LOG_ENABLED = True
     LOG_DIRECTORY = './logs'
     LOG_SENSOR_DATA = True
     LOG_EVENTS = True
+    LOG_ISO_TIMESTAMPS = False  # Add a human-readable 'datetime' (1 s precision)
+    LOG_QUEUE_SIZE = 4096       # Max batches waiting for the writer
+    LOG_WRITER_PROCESS = False  # Write logs from a separate process (multi-core Pi)
+    LOG_BATCH_ENTRIES = 64      # Hand entries to the writer in batches of N...
+    LOG_BATCH_BYTES = 32768     # ...or once this many bytes are pending
+    LOG_BATCH_MAX_AGE = 1.0     # ...or once the oldest pending entry is this old (seconds)
+    LOG_WRITE_DEPTH = 16        # Max queued batches gathered into one writev
+    LOG_ROTATE_BYTES = 16 * 1024 * 1024  # Start a new log file past this size
     
     # ========== SENSOR LIMITS ==========
     MAX_SENSOR_DISTANCE = 4.0  # Maximum reliable sensor range (meters)
     MIN_SENSOR_DISTANCE = 0.02  # Minimum sensor range (meters)
+    ECHO_TIMEOUT = 0.04         # Max wait for an echo (seconds); 4 m round trip is ~23 ms
     
     # ========== WINTER OPTIMIZATION SETTINGS ==========
     COLD_TEMP_COMPENSATION = True  # Adjust for temperature effects on ultrasonic
@@ -55,6 +73,7 @@ class Config:
     POTHOLE_THRESHOLD = 0.15            # Minimum depth to classify as pothole (meters)
     CURB_THRESHOLD = 0.10               # Minimum height to classify as curb (meters)
     MAJOR_DROP_THRESHOLD = 0.30         # Threshold for critical drop-off alert (meters)
+    GROUND_FILTER_WINDOW = 3            # Median filter length for ground readings (samples)
     
     # ========== SYSTEM INFORMATION ==========
     VERSION = "1.0.0"
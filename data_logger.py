@@ -6,15 +6,210 @@ Logs sensor data and events for analysis
 import os
 import json
 import time
+import queue
+import atexit
+import signal
+import threading
+import multiprocessing
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data):
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+class _LogWriter:
+    """Owns the log files and writes queued batches to them"""
+    
+    def __init__(self, log_paths, write_depth, rotate_bytes):
+        """
+        Args:
+            log_paths (dict): Stream name -> log file path
+            write_depth (int): Max queued batches gathered per write pass
+            rotate_bytes (int): Rotate a log file once it reaches this size
+        """
+        self.log_paths = log_paths
+        self.write_depth = write_depth
+        self.rotate_bytes = rotate_bytes
+        self._log_fds = {}
+        self._bytes_written = {}
+        self._rotations = {}
+    
+    def run(self, log_queue):
+        """
+        Write queued batches until the None sentinel arrives
+        
+        Runs on the writer thread, or in the writer process when
+        LOG_WRITER_PROCESS is set.
+        
+        Args:
+            log_queue: Queue of (stream, bytes) batches
+        """
+        # Raw file descriptors: batching replaces the io module's buffering
+        for stream, path in self.log_paths.items():
+            self._log_fds[stream] = self._open_log(path)
+            self._bytes_written[stream] = os.fstat(self._log_fds[stream]).st_size
+            self._rotations[stream] = 0
+        
+        try:
+            while True:
+                item = log_queue.get()
+                
+                # Gather everything already queued (up to the write depth)
+                # so each file gets a single vectored write per pass
+                chunks = {}
+                count = 0
+                while True:
+                    if item is None:
+                        break
+                    stream, chunk = item
+                    chunks.setdefault(stream, []).append(chunk)
+                    count += 1
+                    if count >= self.write_depth:
+                        break
+                    try:
+                        item = log_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                
+                for stream, stream_chunks in chunks.items():
+                    self._write_log(stream, stream_chunks)
+                
+                if item is None:
+                    return
+        finally:
+            for fd in self._log_fds.values():
+                os.close(fd)
+    
+    def run_process(self, log_queue):
+        """
+        Writer process entry point
+        
+        Ctrl+C reaches every process in the foreground group; the writer
+        ignores it and keeps draining until the parent's stop() sends the
+        None sentinel.
+        
+        Args:
+            log_queue: Queue of (stream, bytes) batches
+        """
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self.run(log_queue)
+    
+    def write_remaining(self, batches):
+        """
+        Write batches straight to the log files, without the writer loop
+        
+        Used by DataLogger.stop() when the writer has already died.
+        
+        Args:
+            batches (list): (stream, bytes) batches, oldest first
+        """
+        chunks = {}
+        for stream, chunk in batches:
+            chunks.setdefault(stream, []).append(chunk)
+        
+        for stream, stream_chunks in chunks.items():
+            fd = self._open_log(self.log_paths[stream])
+            try:
+                view = memoryview(b''.join(stream_chunks))
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
+    
+    def _write_log(self, stream, chunks):
+        """
+        Write batches of serialized log entries to a log file
+        
+        Args:
+            stream (str): 'session' or 'event'
+            chunks (list): Newline-terminated JSON line batches (bytes)
+        """
+        fd = self._log_fds[stream]
+        total = sum(len(chunk) for chunk in chunks)
+        
+        try:
+            written = 0
+            if len(chunks) > 1 and hasattr(os, 'writev'):
+                written = os.writev(fd, chunks)
+            
+            if written < total:
+                view = memoryview(b''.join(chunks))[written:]
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            
+            self._bytes_written[stream] += total
+            if self._bytes_written[stream] >= self.rotate_bytes:
+                self._rotate(stream)
+        except Exception as e:
+            print(f"Error writing log: {e}")
+    
+    def _open_log(self, path):
+        """Open a log file for appending and return its descriptor"""
+        return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    
+    def _rotate(self, stream):
+        """
+        Move a full log file aside and start a fresh one at the same path
+        
+        Args:
+            stream (str): 'session' or 'event'
+        """
+        path = self.log_paths[stream]
+        base, ext = os.path.splitext(path)
+        rotated = f"{base}.{self._rotations[stream] + 1}{ext}"
+        
+        # Rename while still open, so a failure leaves the current
+        # descriptor valid and logging carries on in the same file
+        try:
+            os.rename(path, rotated)
+        except OSError as e:
+            print(f"Error rotating log: {e}")
+            self._bytes_written[stream] = 0  # Retry after another rotate_bytes
+            return
+        
+        self._rotations[stream] += 1
+        old_fd = self._log_fds[stream]
+        self._log_fds[stream] = self._open_log(path)
+        os.close(old_fd)
+        self._bytes_written[stream] = 0
+
+
 class DataLogger:
     """Logger for sensor data and system events"""
     
+    # Event type -> statistics counter it increments
+    EVENT_COUNTERS = {
+        'danger': 'danger_events',
+        'warning': 'warning_events',
+        'alert': 'alert_events',
+        'ground_critical': 'ground_hazards',
+        'ground_warning': 'ground_hazards'
+    }
+    
     def __init__(self, config):
         """Initialize data logger"""
         self.config = config
         self.log_dir = config.LOG_DIRECTORY
+        self.log_sensor_data_enabled = config.LOG_SENSOR_DATA
+        self.log_events_enabled = config.LOG_EVENTS
+        self.log_iso_timestamps = config.LOG_ISO_TIMESTAMPS
+        self._iso_cache = (None, '')  # (whole second, ISO string)
+        
+        # Reused for every sensor record - safe because entries are
+        # serialized before log_sensor_data returns
+        self._sensor_entry = {'timestamp': 0.0, 'type': 'sensor_data', 'data': None}
         
         # Create log directory if it doesn't exist
         if not os.path.exists(self.log_dir):
@@ -33,9 +228,38 @@ class DataLogger:
             'danger_events': 0,
             'warning_events': 0,
             'alert_events': 0,
-            'ground_hazards': 0
+            'ground_hazards': 0,
+            'dropped_entries': 0
         }
         
+        # Serialized entries waiting to be handed over as one batch
+        log_paths = {'session': self.session_file, 'event': self.event_file}
+        self._pending = {stream: bytearray() for stream in log_paths}
+        self._pending_count = {stream: 0 for stream in log_paths}
+        self._pending_since = {stream: 0.0 for stream in log_paths}  # Oldest entry time
+        
+        # Disk writes happen on a background writer so the detection
+        # loop only pays for serialization. A separate process keeps the
+        # writer off the GIL entirely, at the cost of pickling each batch.
+        writer = _LogWriter(log_paths, config.LOG_WRITE_DEPTH, config.LOG_ROTATE_BYTES)
+        self._log_writer = writer
+        self._stopped = False
+        if config.LOG_WRITER_PROCESS:
+            self._log_queue = multiprocessing.Queue(maxsize=config.LOG_QUEUE_SIZE)
+            self._writer = multiprocessing.Process(target=writer.run_process, args=(self._log_queue,))
+        else:
+            self._log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+            self._writer = threading.Thread(target=writer.run, args=(self._log_queue,))
+        self._writer.daemon = True
+        self._writer.start()
+        atexit.register(self.stop)
+        
+        # Disabled log streams are bound to a no-op so callers pay nothing
+        if not self.log_sensor_data_enabled:
+            self.log_sensor_data = self._log_disabled
+        if not self.log_events_enabled:
+            self.log_event = self._log_disabled
+        
         print(f"✓ Logging to: {self.session_file}")
     
     def log_sensor_data(self, sensor_data):
@@ -45,17 +269,15 @@ class DataLogger:
         Args:
             sensor_data (dict): Dictionary of sensor name -> distance readings
         """
-        if not self.config.LOG_SENSOR_DATA:
-            return
+        now = time.time()
+        log_entry = self._sensor_entry
+        log_entry['timestamp'] = now
+        log_entry['data'] = sensor_data
+        if self.log_iso_timestamps:
+            log_entry['datetime'] = self._iso(now)
         
-        log_entry = {
-            'timestamp': time.time(),
-            'datetime': datetime.now().isoformat(),
-            'type': 'sensor_data',
-            'data': sensor_data
-        }
-        
-        self._write_log(self.session_file, log_entry)
+        self._enqueue('session', log_entry, now)
+        log_entry['data'] = None
         self.stats['total_readings'] += 1
     
     def log_event(self, event_type, sensor_name, distance_or_hazard):
@@ -67,16 +289,15 @@ class DataLogger:
             sensor_name (str): Name of sensor that detected obstacle
             distance_or_hazard: Distance (float) or hazard dict
         """
-        if not self.config.LOG_EVENTS:
-            return
-        
+        now = time.time()
         log_entry = {
-            'timestamp': time.time(),
-            'datetime': datetime.now().isoformat(),
+            'timestamp': now,
             'type': 'event',
             'event_type': event_type,
             'sensor': sensor_name,
         }
+        if self.log_iso_timestamps:
+            log_entry['datetime'] = self._iso(now)
         
         # Handle different data types
         if isinstance(distance_or_hazard, dict):
@@ -84,30 +305,122 @@ class DataLogger:
         else:
             log_entry['distance'] = distance_or_hazard
         
-        self._write_log(self.event_file, log_entry)
+        self._enqueue('event', log_entry, now)
         
         # Update statistics
-        if 'danger' in event_type:
-            self.stats['danger_events'] += 1
-        elif 'warning' in event_type:
-            self.stats['warning_events'] += 1
-        elif 'alert' in event_type:
-            self.stats['alert_events'] += 1
+        counter = self.EVENT_COUNTERS.get(event_type)
+        if counter is not None:
+            self.stats[counter] += 1
+    
+    @staticmethod
+    def _log_disabled(*args, **kwargs):
+        """Stand-in for a log method whose stream is disabled"""
+    
+    def _iso(self, now):
+        """
+        Human-readable timestamp, formatted at most once per second
         
-        if 'ground' in event_type:
-            self.stats['ground_hazards'] += 1
+        Args:
+            now (float): Unix timestamp of the log entry
+            
+        Returns:
+            str: ISO 8601 timestamp with one second precision
+        """
+        second = int(now)
+        if self._iso_cache[0] != second:
+            self._iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+        return self._iso_cache[1]
     
-    def _write_log(self, filename, data):
+    def _enqueue(self, stream, data, now):
         """
-        Write log entry to file
+        Serialize log entry and add it to the pending batch for its file
         
         Args:
-            filename (str): Log file path
+            stream (str): 'session' or 'event'
             data (dict): Data to log
+            now (float): Unix timestamp of the log entry
+        """
+        try:
+            line = _dumps(data)
+        except Exception as e:
+            print(f"Error writing log: {e}")
+            return
+        
+        pending = self._pending[stream]
+        if not pending:
+            self._pending_since[stream] = now
+        pending += line
+        pending += b'\n'
+        self._pending_count[stream] += 1
+        
+        if (self._pending_count[stream] >= self.config.LOG_BATCH_ENTRIES or
+                len(pending) >= self.config.LOG_BATCH_BYTES):
+            self._submit(stream)
+        
+        # No batch waits long in memory, where a crash would lose it. Every
+        # stream is checked, so a burst of events still reaches the writer
+        # once it goes quiet, as long as sensor data keeps arriving.
+        max_age = self.config.LOG_BATCH_MAX_AGE
+        for stream, count in self._pending_count.items():
+            if count and now - self._pending_since[stream] >= max_age:
+                self._submit(stream)
+    
+    def _submit(self, stream):
+        """
+        Hand the pending batch for a file to the writer
+        
+        Args:
+            stream (str): 'session' or 'event'
         """
+        pending = self._pending[stream]
+        if not pending:
+            return
+        
+        try:
+            self._log_queue.put_nowait((stream, bytes(pending)))
+        except queue.Full:
+            # Never block the detection loop on a slow disk
+            self.stats['dropped_entries'] += self._pending_count[stream]
+        
+        pending.clear()
+        self._pending_count[stream] = 0
+    
+    def flush(self):
+        """Hand all pending log entries to the writer"""
+        for stream in self._pending:
+            self._submit(stream)
+    
+    def stop(self):
+        """Write out pending entries, stop the writer and close log files"""
+        if self._stopped:
+            return
+        self._stopped = True
+        
+        if self._writer.is_alive():
+            self.flush()
+            self._log_queue.put(None)
+            self._writer.join(timeout=2.0)
+            return
+        
+        # The writer died early (crashed or was killed) - write out what it
+        # left queued, plus the pending batches, from here
+        batches = []
+        while True:
+            try:
+                item = self._log_queue.get(timeout=0.1)
+            except queue.Empty:
+                break
+            if item is not None:
+                batches.append(item)
+        
+        for stream, pending in self._pending.items():
+            if pending:
+                batches.append((stream, bytes(pending)))
+                pending.clear()
+                self._pending_count[stream] = 0
+        
         try:
-            with open(filename, 'a') as f:
-                f.write(json.dumps(data) + '\n')
+            self._log_writer.write_remaining(batches)
         except Exception as e:
             print(f"Error writing log: {e}")
     
@@ -118,6 +431,7 @@ class DataLogger:
         Returns:
             dict: Session statistics
         """
+        self.flush()
         runtime = time.time() - self.stats['session_start']
         
         return {
@@ -128,6 +442,7 @@ class DataLogger:
             'warning_events': self.stats['warning_events'],
             'alert_events': self.stats['alert_events'],
             'ground_hazards': self.stats['ground_hazards'],
+            'dropped_entries': self.stats['dropped_entries'],
             'readings_per_second': self.stats['total_readings'] / runtime if runtime > 0 else 0
         }
     
@@ -145,8 +460,14 @@ class DataLogger:
         summary = self.get_session_summary()
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(summary, f, indent=2)
+            # Serialize up front so the file gets a single write
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(summary, indent=2).encode('utf-8')
+            
+            with open(filename, 'wb') as f:
+                f.write(data)
             print(f"✓ Summary exported to: {filename}")
         except Exception as e:
             print(f"Error exporting summary: {e}")
\ No newline at end of file
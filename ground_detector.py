@@ -3,6 +3,8 @@ Ground Detector
 """
 
 import time
+from array import array
+from statistics import median
 
 class GroundDetector:
     """Detect ground-level hazards using downward-facing sensor"""
@@ -11,9 +13,28 @@ class GroundDetector:
         """Initialize ground detector"""
         self.config = config
         self.baseline_distance = None  # Calibrated ground distance
-        self.calibration_readings = []
+        
+        # Preallocated calibration buffer, filled in place
+        samples = config.GROUND_CALIBRATION_SAMPLES
+        self.calibration_readings = array('d', [0.0]) * samples
+        self.calibration_count = 0
         self.calibrated = False
         
+        # Ring buffer of recent ground readings for outlier rejection
+        self._ground_buffer = array('d', [0.0]) * config.GROUND_FILTER_WINDOW
+        self._ground_index = 0
+        self._ground_count = 0
+        
+        # Hazard thresholds, read once instead of per reading
+        self.pothole_threshold = config.POTHOLE_THRESHOLD
+        self.major_drop_threshold = config.MAJOR_DROP_THRESHOLD
+        self.curb_threshold = config.CURB_THRESHOLD
+        self.slope_threshold = 0.05
+        
+        # Deviations inside this band can't match any hazard
+        self._normal_band = min(self.pothole_threshold, self.curb_threshold,
+                                self.slope_threshold)
+        
         print("✓ Ground hazard detector initialized")
     
     def calibrate(self, readings):
@@ -27,17 +48,19 @@ class GroundDetector:
         if 'ground_sensor' not in readings or readings['ground_sensor'] is None:
             return
         
-        self.calibration_readings.append(readings['ground_sensor'])
+        samples = len(self.calibration_readings)
+        if self.calibration_count >= samples:
+            return
+        
+        self.calibration_readings[self.calibration_count] = readings['ground_sensor']
+        self.calibration_count += 1
         
-        if len(self.calibration_readings) >= self.config.GROUND_CALIBRATION_SAMPLES:
+        if self.calibration_count == samples:
             # Average of middle 80% (remove outliers)
             sorted_readings = sorted(self.calibration_readings)
             # Remove top and bottom 10%
-            trim_count = len(sorted_readings) // 10
-            if trim_count > 0:
-                middle_readings = sorted_readings[trim_count:-trim_count]
-            else:
-                middle_readings = sorted_readings
+            trim_count = samples // 10
+            middle_readings = sorted_readings[trim_count:samples - trim_count]
             
             self.baseline_distance = sum(middle_readings) / len(middle_readings)
             self.calibrated = True
@@ -57,11 +80,27 @@ class GroundDetector:
         if not self.calibrated or current_distance is None:
             return None
         
-        deviation = current_distance - self.baseline_distance
+        buffer = self._ground_buffer
+        window = len(buffer)
+        buffer[self._ground_index] = current_distance
+        self._ground_index = (self._ground_index + 1) % window
+        if self._ground_count < window:
+            # Window still filling - use the raw reading
+            self._ground_count += 1
+            filtered_distance = current_distance
+        else:
+            # Median of recent readings ignores single-sample spikes
+            filtered_distance = median(buffer)
+        
+        deviation = filtered_distance - self.baseline_distance
+        
+        # Common case - flat ground
+        if -self._normal_band <= deviation <= self._normal_band:
+            return None
         
         # Sudden increase in distance = ground dropped away
-        if deviation > self.config.POTHOLE_THRESHOLD:
-            severity = 'critical' if deviation > self.config.MAJOR_DROP_THRESHOLD else 'warning'
+        if deviation > self.pothole_threshold:
+            severity = 'critical' if deviation > self.major_drop_threshold else 'warning'
             return {
                 'type': 'drop_off',
                 'depth': deviation,
@@ -70,7 +109,7 @@ class GroundDetector:
             }
         
         # Sudden decrease in distance = raised obstacle
-        elif deviation < -self.config.CURB_THRESHOLD:
+        elif deviation < -self.curb_threshold:
             return {
                 'type': 'raised_surface',
                 'height': abs(deviation),
@@ -79,7 +118,7 @@ class GroundDetector:
             }
         
         # Gradual change = slope or ramp
-        elif abs(deviation) > 0.05:
+        elif abs(deviation) > self.slope_threshold:
             return {
                 'type': 'slope',
                 'change': deviation,
@@ -156,7 +195,7 @@ class GroundDetector:
         """Get calibration status information"""
         return {
             'calibrated': self.calibrated,
-            'samples_collected': len(self.calibration_readings),
+            'samples_collected': self.calibration_count,
             'samples_needed': self.config.GROUND_CALIBRATION_SAMPLES,
             'baseline_distance': self.baseline_distance
         }
\ No newline at end of file
@@ -11,23 +11,65 @@ try:
 except ImportError:
     RASPBERRY_PI = False
 
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
 class HapticController:
     """Controller for managing haptic feedback motors"""
     
+    # Vibration patterns (on_time, off_time in seconds)
+    PATTERNS = {
+        'rapid': (0.1, 0.1),          # Fast pulsing - danger
+        'pulse': (0.3, 0.3),          # Medium pulsing - warning
+        'intermittent': (0.2, 0.8)    # Slow pulsing - alert
+    }
+    
+    # Vibration intensity (duty cycle if using PWM, or just on/off)
+    INTENSITIES = {
+        'low': 0.3,
+        'medium': 0.6,
+        'high': 1.0
+    }
+    
     def __init__(self, config):
         """Initialize haptic controller"""
         self.config = config
         self.motors = config.HAPTIC_MOTORS
-        self.active_alerts = {}  # Track active vibration threads
         self.motor_states = {name: False for name in self.motors}
         
-        if RASPBERRY_PI:
+        # Active patterns: motor -> [on_ticks, off_ticks, strength, phase]
+        self._motor_cfg = {}
+        self._lock = threading.Lock()
+        self._active = threading.Event()  # Set while any pattern is running
+        self.tick_interval = config.HAPTIC_TICK_INTERVAL
+        
+        # Prefer the pigpio daemon: its DMA-timed PWM sets motor strength
+        # without any CPU involvement
+        self.pi = None
+        if PIGPIO_AVAILABLE:
+            pi = pigpio.pi()
+            if pi.connected:
+                self.pi = pi
+        
+        if self.pi is not None:
+            for motor_name, pin in self.motors.items():
+                self.pi.set_mode(pin, pigpio.OUTPUT)
+                self.pi.set_PWM_dutycycle(pin, 0)
+        elif RASPBERRY_PI:
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
             for motor_name, pin in self.motors.items():
                 GPIO.setup(pin, GPIO.OUT)
                 GPIO.output(pin, False)
         
+        # One scheduler thread drives every motor's pattern
+        self._tick_thread = threading.Thread(target=self._scheduler)
+        self._tick_thread.daemon = True
+        self._tick_thread.start()
+        
         print(f"✓ Initialized {len(self.motors)} haptic motors")
     
     def alert(self, sensor_name, intensity='medium', pattern='pulse'):
@@ -45,42 +87,43 @@ class HapticController:
         if motor_name not in self.motors:
             return
         
-        # Stop existing alert for this motor if any
-        if motor_name in self.active_alerts:
-            self.active_alerts[motor_name]['stop'] = True
-            time.sleep(0.05)  # Brief pause for cleanup
-        
-        # Start new alert thread
-        alert_control = {'stop': False}
-        alert_thread = threading.Thread(
-            target=self._vibrate_pattern,
-            args=(motor_name, intensity, pattern, alert_control)
-        )
-        alert_thread.daemon = True
-        alert_thread.start()
-        
-        self.active_alerts[motor_name] = alert_control
+        on_time, off_time = self.PATTERNS.get(pattern, (0.3, 0.3))
+        strength = self.INTENSITIES.get(intensity, 0.6)
+        on_ticks = max(1, round(on_time / self.tick_interval))
+        off_ticks = max(1, round(off_time / self.tick_interval))
+        
+        with self._lock:
+            current = self._motor_cfg.get(motor_name)
+            
+            # Same alert re-triggered - keep the pattern's phase running
+            if current is not None and current[:3] == [on_ticks, off_ticks, strength]:
+                return
+            
+            self._motor_cfg[motor_name] = [on_ticks, off_ticks, strength, 0]
+            
+            # The scheduler only switches motors on from off, so a motor
+            # already running picks up the new strength here
+            if self.motor_states[motor_name] and (current is None or current[2] != strength):
+                self._motor_on(motor_name, strength)
+            
+            self._active.set()
     
     def stop(self, sensor_name):
         """Stop haptic alert for a specific sensor"""
         motor_name = self._sensor_to_motor(sensor_name)
         
-        if motor_name in self.active_alerts:
-            self.active_alerts[motor_name]['stop'] = True
-            self._motor_off(motor_name)
+        with self._lock:
+            if self._motor_cfg.pop(motor_name, None) is not None:
+                self._motor_off(motor_name)
     
     def stop_all(self):
         """Stop all haptic feedback"""
-        for motor_name in list(self.active_alerts.keys()):
-            self.active_alerts[motor_name]['stop'] = True
-        
-        time.sleep(0.1)  # Allow threads to stop
-        
-        # Turn off all motors
-        for motor_name in self.motors:
-            self._motor_off(motor_name)
-        
-        self.active_alerts.clear()
+        with self._lock:
+            self._motor_cfg.clear()
+            
+            # Turn off all motors
+            for motor_name in self.motors:
+                self._motor_off(motor_name)
     
     def _sensor_to_motor(self, sensor_name):
         """Map sensor name to corresponding motor"""
@@ -94,46 +137,30 @@ class HapticController:
         }
         return mapping.get(sensor_name, 'front_center')
     
-    def _vibrate_pattern(self, motor_name, intensity, pattern, control):
-        """
-        Execute vibration pattern in separate thread
-        
-        Args:
-            motor_name (str): Name of motor to vibrate
-            intensity (str): Vibration strength
-            pattern (str): Vibration pattern type
-            control (dict): Control dictionary with 'stop' flag
-        """
-        # Define patterns (on_time, off_time in seconds)
-        patterns = {
-            'rapid': (0.1, 0.1),          # Fast pulsing - danger
-            'pulse': (0.3, 0.3),          # Medium pulsing - warning
-            'intermittent': (0.2, 0.8)    # Slow pulsing - alert
-        }
-        
-        # Define intensity (duty cycle if using PWM, or just on/off)
-        intensities = {
-            'low': 0.3,
-            'medium': 0.6,
-            'high': 1.0
-        }
-        
-        on_time, off_time = patterns.get(pattern, (0.3, 0.3))
-        strength = intensities.get(intensity, 0.6)
-        
-        # Continue pattern until stopped
-        while not control['stop']:
-            self._motor_on(motor_name, strength)
-            time.sleep(on_time)
+    def _scheduler(self):
+        """Advance all active vibration patterns - runs in background thread"""
+        while True:
+            # Sleep until an alert arrives instead of ticking while idle
+            self._active.wait()
             
-            if control['stop']:
-                break
+            with self._lock:
+                if not self._motor_cfg:
+                    self._active.clear()
+                    continue
                 
-            self._motor_off(motor_name)
-            time.sleep(off_time)
-        
-        # Ensure motor is off when done
-        self._motor_off(motor_name)
+                for motor_name, cfg in self._motor_cfg.items():
+                    on_ticks, off_ticks, strength, phase = cfg
+                    
+                    # On for the first on_ticks of each period, then off
+                    if phase < on_ticks:
+                        if not self.motor_states[motor_name]:
+                            self._motor_on(motor_name, strength)
+                    elif self.motor_states[motor_name]:
+                        self._motor_off(motor_name)
+                    
+                    cfg[3] = (phase + 1) % (on_ticks + off_ticks)
+            
+            time.sleep(self.tick_interval)
     
     def _motor_on(self, motor_name, strength=1.0):
         """Turn motor on with specified strength"""
@@ -142,9 +169,10 @@ class HapticController:
         
         pin = self.motors[motor_name]
         
-        if RASPBERRY_PI:
-            # For full implementation, use PWM for variable strength
-            # For now, simple on/off
+        if self.pi is not None:
+            self.pi.set_PWM_dutycycle(pin, int(strength * 255))
+        elif RASPBERRY_PI:
+            # No PWM without pigpio - simple on/off
             GPIO.output(pin, True)
         else:
             if not self.motor_states.get(motor_name, False):
@@ -159,7 +187,9 @@ class HapticController:
         
         pin = self.motors[motor_name]
         
-        if RASPBERRY_PI:
+        if self.pi is not None:
+            self.pi.set_PWM_dutycycle(pin, 0)
+        elif RASPBERRY_PI:
             GPIO.output(pin, False)
         else:
             if self.motor_states.get(motor_name, False):
@@ -7,6 +7,8 @@ Date: January 2026
 
 import time
 import threading
+from bisect import bisect_right
+from collections import deque
 from sensor_controller import SensorController
 from haptic_controller import HapticController
 from data_logger import DataLogger
@@ -32,11 +34,28 @@ class PathSense:
         self.ground_detector = GroundDetector(self.config)
         self.winter_optimizer = WinterOptimizer(self.config)
         
+        # Detection zone lookup: upper bounds and matching responses
+        self._zone_bounds = (
+            self.config.DANGER_ZONE,
+            self.config.WARNING_ZONE,
+            self.config.ALERT_ZONE
+        )
+        self._zone_actions = (
+            ('danger', 'high', 'rapid'),        # Critical - strong rapid vibration
+            ('warning', 'medium', 'pulse'),     # Warning - moderate pulsing vibration
+            ('alert', 'low', 'intermittent')    # Alert - gentle intermittent vibration
+        )
+        
         # System state
         self.running = False
         self.detection_thread = None
         self.start_time = None
         self.total_detections = 0
+        self.overrun_count = 0  # Scan cycles that exceeded SCAN_INTERVAL
+        
+        # Latest (raw sensor_data, ground_hazard) samples for display consumers;
+        # oldest samples fall off if nobody drains them
+        self.recent_readings = deque(maxlen=32)
         
         print("PathSense initialized successfully!")
         print("=" * 60)
@@ -75,6 +94,9 @@ class PathSense:
         # Stop all haptic feedback
         self.haptic_controller.stop_all()
         
+        # Flush pending log entries and close log files
+        self.data_logger.stop()
+        
         # Print session summary
         self._print_summary()
         
@@ -83,12 +105,14 @@ class PathSense:
     def _detection_loop(self):
         """Main detection loop - runs continuously"""
         calibration_count = 0
-        sensor_history = {name: [] for name in self.config.SENSORS}
+        sensor_history = {name: deque(maxlen=5) for name in self.config.SENSORS}
+        next_tick = time.monotonic()
         
         while self.running:
             try:
                 # Read all sensors
                 sensor_data = self.sensor_controller.read_all_sensors()
+                raw_data = sensor_data
                 
                 # Ground sensor calibration (first 5 seconds)
                 if not self.ground_detector.calibrated and calibration_count < 50:
@@ -108,10 +132,9 @@ class PathSense:
                 for sensor_name, distance in sensor_data.items():
                     if distance is not None:
                         if sensor_name not in sensor_history:
-                            sensor_history[sensor_name] = []
+                            sensor_history[sensor_name] = deque(maxlen=5)
+                        # Keeps only the last 5 readings
                         sensor_history[sensor_name].append(distance)
-                        # Keep only last 5 readings
-                        sensor_history[sensor_name] = sensor_history[sensor_name][-5:]
                 
                 # Process upper-body obstacles
                 for sensor_name, distance in sensor_data.items():
@@ -119,6 +142,7 @@ class PathSense:
                         self._process_obstacle(sensor_name, distance)
                 
                 # Process ground hazards
+                hazard = None
                 if 'ground_sensor' in sensor_data and sensor_data['ground_sensor']:
                     hazard = self.ground_detector.detect_hazard(sensor_data['ground_sensor'])
                     if hazard:
@@ -127,12 +151,23 @@ class PathSense:
                 # Log data for analysis
                 self.data_logger.log_sensor_data(sensor_data)
                 
-                # Small delay to prevent CPU overload
-                time.sleep(self.config.SCAN_INTERVAL)
+                # Publish raw readings for display (deque appends are thread-safe)
+                self.recent_readings.append((raw_data, hazard))
+                
+                # Wait for the next scan slot so the rate doesn't drift
+                next_tick += self.config.SCAN_INTERVAL
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Work took longer than a scan interval - don't try to catch up
+                    self.overrun_count += 1
+                    next_tick = time.monotonic()
                 
             except Exception as e:
                 print(f"Error in detection loop: {e}")
                 time.sleep(0.5)
+                next_tick = time.monotonic()
     
     def _process_obstacle(self, sensor_name, distance):
         """
@@ -146,25 +181,19 @@ class PathSense:
         distance = self.winter_optimizer.adjust_for_temperature(distance)
         
         # Determine danger level based on distance
-        if distance < self.config.DANGER_ZONE:
-            # Critical - strong rapid vibration
-            self.haptic_controller.alert(sensor_name, intensity='high', pattern='rapid')
-            self.data_logger.log_event('danger', sensor_name, distance)
-            self.total_detections += 1
-            
-        elif distance < self.config.WARNING_ZONE:
-            # Warning - moderate pulsing vibration
-            self.haptic_controller.alert(sensor_name, intensity='medium', pattern='pulse')
-            self.data_logger.log_event('warning', sensor_name, distance)
-            
-        elif distance < self.config.ALERT_ZONE:
-            # Alert - gentle intermittent vibration
-            self.haptic_controller.alert(sensor_name, intensity='low', pattern='intermittent')
-            self.data_logger.log_event('alert', sensor_name, distance)
-            
-        else:
+        zone = bisect_right(self._zone_bounds, distance)
+        
+        if zone == len(self._zone_actions):
             # No obstacle in range - stop vibration for this sensor
             self.haptic_controller.stop(sensor_name)
+            return
+        
+        event_type, intensity, pattern = self._zone_actions[zone]
+        self.haptic_controller.alert(sensor_name, intensity=intensity, pattern=pattern)
+        self.data_logger.log_event(event_type, sensor_name, distance)
+        
+        if zone == 0:
+            self.total_detections += 1
     
     def _process_ground_hazard(self, hazard):
         """
@@ -199,6 +228,7 @@ class PathSense:
             'battery_level': self._get_battery_level(),
             'uptime': time.time() - self.start_time if self.start_time else 0,
             'total_detections': self.total_detections,
+            'loop_overruns': self.overrun_count,
             'ground_calibrated': self.ground_detector.calibrated,
             'winter_mode': self.config.SNOW_FILTER_ENABLED
         }
@@ -217,6 +247,7 @@ class PathSense:
             print("=" * 60)
             print(f"Runtime: {runtime:.1f} seconds ({runtime/60:.1f} minutes)")
             print(f"Total obstacle detections: {self.total_detections}")
+            print(f"Scan overruns: {self.overrun_count}")
             print(f"Winter optimization: {'Active' if self.config.SNOW_FILTER_ENABLED else 'Inactive'}")
             print("=" * 60)
 
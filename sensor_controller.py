@@ -3,13 +3,34 @@ Sensor Controller
 """
 
 import time
+import random
+import threading
+from array import array
 
 try:
     import RPi.GPIO as GPIO
     RASPBERRY_PI = True
 except ImportError:
     RASPBERRY_PI = False
-    print("⚠️  Warning: RPi.GPIO not available. Running in simulation mode.")
+
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
+# Speed of sound at 20°C in m/s; an echo of t microseconds covers
+# t * 343 / 20000 centimeters each way
+SPEED_OF_SOUND = 343
+
+# Simulated obstacle distance range (meters) for each upper sensor
+SIMULATED_RANGES = {
+    'front_high': (1.5, 4.0),     # Overhead - usually clear
+    'front_center': (0.8, 3.5),   # Chest - occasional obstacles
+    'front_low': (1.0, 3.5),      # Knee - occasional obstacles
+    'left_side': (1.5, 4.0),      # Left - usually clear
+    'right_side': (1.5, 4.0)      # Right - usually clear
+}
 
 class SensorController:
     """Controller for managing multiple ultrasonic sensors"""
@@ -22,19 +43,75 @@ class SensorController:
         # Add ground sensor
         self.sensors['ground_sensor'] = config.GROUND_SENSOR
         
-        if RASPBERRY_PI:
+        # Parallel per-sensor arrays for the read paths, indexed by position
+        self._names = tuple(self.sensors)
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self._trig_pins = array('i', [pins['trigger'] for pins in self.sensors.values()])
+        self._echo_pins = array('i', [pins['echo'] for pins in self.sensors.values()])
+        
+        # Valid range in whole centimeters, so echoes are checked with integer math
+        self._min_cm = round(config.MIN_SENSOR_DISTANCE * 100)
+        self._max_cm = round(config.MAX_SENSOR_DISTANCE * 100)
+        
+        # Prefer the pigpio daemon: it timestamps echo edges in hardware
+        # and wakes us through callbacks instead of busy-waiting
+        self.pi = None
+        if PIGPIO_AVAILABLE:
+            pi = pigpio.pi()
+            if pi.connected:
+                self.pi = pi
+        
+        if self.pi is not None:
+            self._echo_state = {}  # echo pin -> edge timing for one sensor
+            self._callbacks = []
+            
+            for trigger_pin, echo_pin in zip(self._trig_pins, self._echo_pins):
+                self.pi.set_mode(trigger_pin, pigpio.OUTPUT)
+                self.pi.set_mode(echo_pin, pigpio.INPUT)
+                self.pi.write(trigger_pin, 0)
+                
+                self._echo_state[echo_pin] = {
+                    'rise_tick': None,
+                    'pulse_us': None,
+                    'done': threading.Event()
+                }
+                self._callbacks.append(
+                    self.pi.callback(echo_pin, pigpio.EITHER_EDGE, self._on_echo_edge)
+                )
+            
+            # Sensors that can ping at the same time without hearing each
+            # other's echoes; any sensor not listed is read on its own
+            grouped = set()
+            self._sensor_groups = []  # Lists of sensor indices
+            for group in config.SENSOR_GROUPS:
+                group = [self._idx[name] for name in group
+                         if name in self._idx and self._idx[name] not in grouped]
+                if group:
+                    self._sensor_groups.append(group)
+                    grouped.update(group)
+            for idx in range(len(self._names)):
+                if idx not in grouped:
+                    self._sensor_groups.append([idx])
+        
+        elif RASPBERRY_PI:
             # Set up GPIO pins
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
             
-            for sensor_name, pins in self.sensors.items():
-                GPIO.setup(pins['trigger'], GPIO.OUT)
-                GPIO.setup(pins['echo'], GPIO.IN)
-                GPIO.output(pins['trigger'], False)
+            for trigger_pin, echo_pin in zip(self._trig_pins, self._echo_pins):
+                GPIO.setup(trigger_pin, GPIO.OUT)
+                GPIO.setup(echo_pin, GPIO.IN)
+                GPIO.output(trigger_pin, False)
             
             # Let sensors settle
             time.sleep(0.1)
         
+        else:
+            print("⚠️  Warning: No pigpio daemon or RPi.GPIO available. Running in simulation mode.")
+            
+            # Simulation mode gets its own generator
+            self._rng = random.Random()
+        
         print(f"✓ Initialized {len(self.sensors)} sensors")
         for sensor_name in self.sensors:
             print(f"  - {sensor_name}")
@@ -46,11 +123,37 @@ class SensorController:
         Returns:
             dict: Sensor name -> distance in meters
         """
+        if self.pi is not None:
+            return self._read_all_pigpio()
+        
         readings = {}
         
-        for sensor_name in self.sensors:
-            distance = self.read_sensor(sensor_name)
-            readings[sensor_name] = distance
+        names = self._names
+        for idx in range(len(names)):
+            readings[names[idx]] = self._read_by_index(idx)
+        
+        return readings
+    
+    def _read_all_pigpio(self):
+        """
+        Read all sensors, pinging each non-interfering group at once
+        
+        A group's echoes are collected against one shared deadline, so a
+        group costs its slowest echo rather than the sum of all of them.
+        
+        Returns:
+            dict: Sensor name -> distance in meters
+        """
+        names = self._names
+        readings = dict.fromkeys(names)
+        
+        for group in self._sensor_groups:
+            for idx in group:
+                self._trigger_echo(idx)
+            
+            deadline = time.monotonic() + self.config.ECHO_TIMEOUT
+            for idx in group:
+                readings[names[idx]] = self._collect_echo(idx, deadline)
         
         return readings
     
@@ -64,21 +167,124 @@ class SensorController:
         Returns:
             float: Distance in meters, or None if error
         """
-        if sensor_name not in self.sensors:
+        idx = self._idx.get(sensor_name)
+        if idx is None:
             print(f"Error: Unknown sensor '{sensor_name}'")
             return None
         
-        if RASPBERRY_PI:
-            return self._read_ultrasonic_gpio(sensor_name)
+        return self._read_by_index(idx)
+    
+    def _read_by_index(self, idx):
+        """
+        Read distance from the sensor at a position in the pin arrays
+        
+        Args:
+            idx (int): Sensor index
+            
+        Returns:
+            float: Distance in meters, or None if error
+        """
+        if self.pi is not None:
+            return self._read_ultrasonic_pigpio(idx)
+        elif RASPBERRY_PI:
+            return self._read_ultrasonic_gpio(idx)
         else:
             # Simulation mode - return realistic distances
-            return self._simulate_reading(sensor_name)
+            return self._simulate_reading(self._names[idx])
+    
+    def _on_echo_edge(self, gpio, level, tick):
+        """
+        pigpio callback for echo pin edges
+        
+        Args:
+            gpio (int): Echo pin that changed
+            level (int): 1 = rising, 0 = falling, 2 = watchdog timeout
+            tick (int): Edge time in microseconds since boot (wraps at 2^32)
+        """
+        state = self._echo_state[gpio]
+        
+        if level == 1:
+            state['rise_tick'] = tick
+        elif level == 0 and state['rise_tick'] is not None:
+            state['pulse_us'] = (tick - state['rise_tick']) & 0xFFFFFFFF
+            state['done'].set()
     
-    def _read_ultrasonic_gpio(self, sensor_name):
+    def _read_ultrasonic_pigpio(self, idx):
+        """Read ultrasonic sensor using pigpio edge callbacks"""
+        if not self._trigger_echo(idx):
+            return None
+        
+        return self._collect_echo(idx, time.monotonic() + self.config.ECHO_TIMEOUT)
+    
+    def _trigger_echo(self, idx):
+        """
+        Reset echo state and fire a sensor's trigger pulse
+        
+        Args:
+            idx (int): Sensor index
+            
+        Returns:
+            bool: True if the trigger was sent
+        """
+        state = self._echo_state[self._echo_pins[idx]]
+        
+        try:
+            state['rise_tick'] = None
+            state['pulse_us'] = None
+            state['done'].clear()
+            
+            # Hardware-timed 10 microsecond trigger pulse
+            self.pi.gpio_trigger(self._trig_pins[idx], 10, 1)
+            return True
+            
+        except Exception as e:
+            print(f"Error reading sensor {self._names[idx]}: {e}")
+            return False
+    
+    def _collect_echo(self, idx, deadline):
+        """
+        Wait for a triggered sensor's echo and convert it to a distance
+        
+        Args:
+            idx (int): Index of sensor that was triggered
+            deadline (float): time.monotonic() value to give up at
+            
+        Returns:
+            float: Distance in meters, or None if error
+        """
+        state = self._echo_state[self._echo_pins[idx]]
+        
+        # Sleep until the falling edge arrives
+        if not state['done'].wait(timeout=max(0.0, deadline - time.monotonic())):
+            return None  # Timeout
+        
+        return self._echo_to_distance(state['pulse_us'])
+    
+    def _echo_to_distance(self, pulse_us):
+        """
+        Convert an echo pulse width to a validated distance
+        
+        Integer arithmetic rounds to the nearest centimeter, matching the
+        two decimal places readings have always been reported with.
+        
+        Args:
+            pulse_us (int): Echo pulse width in microseconds
+            
+        Returns:
+            float: Distance in meters, or None if out of range
+        """
+        distance_cm = (pulse_us * SPEED_OF_SOUND + 10_000) // 20_000
+        
+        # Validate reading
+        if self._min_cm <= distance_cm <= self._max_cm:
+            return distance_cm / 100
+        else:
+            return None
+    
+    def _read_ultrasonic_gpio(self, idx):
         """Read ultrasonic sensor using GPIO pins"""
-        pins = self.sensors[sensor_name]
-        trigger_pin = pins['trigger']
-        echo_pin = pins['echo']
+        trigger_pin = self._trig_pins[idx]
+        echo_pin = self._echo_pins[idx]
         
         try:
             # Send trigger pulse
@@ -86,76 +292,71 @@ class SensorController:
             time.sleep(0.00001)  # 10 microsecond pulse
             GPIO.output(trigger_pin, False)
             
-            # Wait for echo
-            timeout = time.time() + 0.1  # 100ms timeout
-            pulse_start = time.time()
-            pulse_end = time.time()
+            # Wait for echo (integer nanoseconds keep the polling loops tight)
+            monotonic_ns = time.monotonic_ns
+            read_pin = GPIO.input
+            deadline_ns = monotonic_ns() + int(self.config.ECHO_TIMEOUT * 1_000_000_000)
+            pulse_start_ns = pulse_end_ns = monotonic_ns()
             
             # Wait for echo to start
-            while GPIO.input(echo_pin) == 0:
-                pulse_start = time.time()
-                if pulse_start > timeout:
+            while read_pin(echo_pin) == 0:
+                pulse_start_ns = monotonic_ns()
+                if pulse_start_ns > deadline_ns:
                     return None  # Timeout
             
             # Wait for echo to end
-            while GPIO.input(echo_pin) == 1:
-                pulse_end = time.time()
-                if pulse_end > timeout:
+            while read_pin(echo_pin) == 1:
+                pulse_end_ns = monotonic_ns()
+                if pulse_end_ns > deadline_ns:
                     return None  # Timeout
             
             # Calculate distance
-            pulse_duration = pulse_end - pulse_start
-            distance = pulse_duration * 17150  # Speed of sound / 2 (in cm)
-            distance = distance / 100  # Convert to meters
-            
-            # Validate reading
-            if self.config.MIN_SENSOR_DISTANCE <= distance <= self.config.MAX_SENSOR_DISTANCE:
-                return round(distance, 2)
-            else:
-                return None
+            return self._echo_to_distance((pulse_end_ns - pulse_start_ns) // 1000)
                 
         except Exception as e:
-            print(f"Error reading sensor {sensor_name}: {e}")
+            print(f"Error reading sensor {self._names[idx]}: {e}")
             return None
     
     def _simulate_reading(self, sensor_name):
         """Simulate sensor reading for testing without hardware"""
-        import random
+        rng = self._rng
         
         # Simulate different scenarios based on sensor position
         if sensor_name == 'ground_sensor':
             # Ground sensor - simulate flat ground with occasional hazards
             base_distance = 1.0  # 1 meter to ground
-            variation = random.uniform(-0.05, 0.05)
             
             # Occasionally simulate a pothole or curb
-            if random.random() < 0.05:  # 5% chance
-                variation = random.uniform(0.2, 0.4)  # Pothole
+            if rng.random() < 0.05:  # 5% chance
+                variation = rng.uniform(0.2, 0.4)  # Pothole
+            else:
+                variation = rng.uniform(-0.05, 0.05)
             
             return round(base_distance + variation, 2)
         
-        # Upper sensors - simulate various obstacle distances
-        scenarios = {
-            'front_high': random.uniform(1.5, 4.0),     # Overhead - usually clear
-            'front_center': random.uniform(0.8, 3.5),   # Chest - occasional obstacles
-            'front_low': random.uniform(1.0, 3.5),      # Knee - occasional obstacles
-            'left_side': random.uniform(1.5, 4.0),      # Left - usually clear
-            'right_side': random.uniform(1.5, 4.0)      # Right - usually clear
-        }
-        
-        # Occasionally add close obstacles for testing
-        distance = scenarios.get(sensor_name, 3.0)
-        if random.random() < 0.1:  # 10% chance of close obstacle
-            distance = random.uniform(0.3, 1.0)
+        # Upper sensors - simulate various obstacle distances,
+        # occasionally adding close obstacles for testing
+        if rng.random() < 0.1:  # 10% chance of close obstacle
+            distance = rng.uniform(0.3, 1.0)
+        elif sensor_name in SIMULATED_RANGES:
+            low, high = SIMULATED_RANGES[sensor_name]
+            distance = rng.uniform(low, high)
+        else:
+            distance = 3.0
         
         return round(distance, 2)
     
     def get_active_sensors(self):
         """Get list of active sensor names"""
-        return list(self.sensors.keys())
+        return list(self._names)
     
     def cleanup(self):
         """Clean up GPIO resources"""
-        if RASPBERRY_PI:
+        if self.pi is not None:
+            for callback in self._callbacks:
+                callback.cancel()
+            self.pi.stop()
+            print("pigpio connection closed")
+        elif RASPBERRY_PI:
             GPIO.cleanup()
             print("GPIO cleaned up")
\ No newline at end of file
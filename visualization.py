@@ -5,6 +5,33 @@ Visualization - real time data
 import time
 import os
 import sys
+from bisect import bisect_right
+
+# Fixed frame lines, built once rather than per frame
+HEADER_RULE = "=" * 70
+HEADER_TITLE = "  PathSense - Real-Time Obstacle Detection System"
+UPPER_BOX_TOP = "┌─ UPPER BODY SENSORS ────────────────────────────────────────┐"
+GROUND_BOX_TOP = "┌─ GROUND HAZARD DETECTION ───────────────────────────────────┐"
+ALERTS_BOX_TOP = "┌─ RECENT GROUND HAZARDS ─────────────────────────────────────┐"
+BOX_BLANK = "│                                                              │"
+BOX_BOTTOM = "└──────────────────────────────────────────────────────────────┘"
+
+UPPER_SENSORS = ('front_high', 'front_center', 'front_low', 'left_side', 'right_side')
+
+# Distance status tiers: upper bounds (meters) and (status, bar char) per tier
+STATUS_BOUNDS = (0.5, 1.5, 3.0)
+STATUS_TIERS = (
+    ("⚠️  DANGER  ", '█'),
+    ("⚡ WARNING ", '▓'),
+    ("ℹ️  ALERT   ", '▒'),
+    ("✓  CLEAR   ", '░')
+)
+
+BAR_LENGTH = 20
+
+# Demo refresh: closest upper reading bounds (meters) and seconds between frames
+REFRESH_BOUNDS = (1.5, 3.0)
+REFRESH_INTERVALS = (0.1, 0.5, 1.0)
 
 class PathSenseVisualizer:
     """Simple console visualization of sensor data"""
@@ -13,7 +40,34 @@ class PathSenseVisualizer:
         """Initialize visualizer"""
         self.last_data = {}
         self.alerts = []
+        self._alert_lines = []  # Formatted frame line for each entry in self.alerts
         self.update_count = 0
+        
+        # Display names for the known sensors
+        self._display_names = {
+            name: name.replace('_', ' ').title()
+            for name in UPPER_SENSORS + ('ground_sensor',)
+        }
+        
+        # Every possible bar: (char, filled cells) -> bar string
+        self._bar_lut = {
+            (char, filled): char * filled + '·' * (BAR_LENGTH - filled)
+            for _, char in STATUS_TIERS
+            for filled in range(BAR_LENGTH + 1)
+        }
+        
+        # Static stretches of the frame between the dynamic rows
+        self._upper_header = "\n".join(
+            [HEADER_RULE, HEADER_TITLE, HEADER_RULE, "", UPPER_BOX_TOP, BOX_BLANK, ""])
+        self._ground_header = "\n".join([BOX_BLANK, BOX_BOTTOM, "", GROUND_BOX_TOP, BOX_BLANK, ""])
+        self._ground_footer = "\n".join([BOX_BLANK, BOX_BOTTOM, ""])
+        self._alerts_header = "\n".join(["", ALERTS_BOX_TOP, ""])
+        self._alerts_footer = BOX_BOTTOM + "\n"
+        
+        # ANSI clear-screen + cursor-home, instead of spawning 'clear'/'cls'
+        self._clear = "\x1b[2J\x1b[H"
+        if os.name == 'nt':
+            os.system('')  # One-time call that enables ANSI escapes in the Windows console
     
     def update(self, sensor_data, ground_hazard=None):
         """
@@ -27,106 +81,108 @@ class PathSenseVisualizer:
         self.update_count += 1
         
         if ground_hazard:
-            self.alerts.append(ground_hazard)
+            self._add_alert(ground_hazard)
             # Keep only last 5 alerts
-            self.alerts = self.alerts[-5:]
+            self._trim_alerts()
         
         self._render()
     
+    def update_batch(self, samples):
+        """
+        Update display with every sample produced since the last frame
+        
+        Only the newest readings are drawn, but no ground hazard in the
+        batch is lost from the alert list.
+        
+        Args:
+            samples (list): (sensor_data, ground_hazard) tuples, oldest first
+        """
+        if not samples:
+            return
+        
+        self.last_data = samples[-1][0]
+        self.update_count += 1
+        
+        for sensor_data, ground_hazard in samples:
+            if ground_hazard:
+                self._add_alert(ground_hazard)
+        # Keep only last 5 alerts
+        self._trim_alerts()
+        
+        self._render()
+    
+    def _add_alert(self, alert):
+        """Record a ground hazard and format its frame line once"""
+        severity_icon = "⚠️ " if alert['severity'] == 'critical' else "⚡" if alert['severity'] == 'warning' else "ℹ️ "
+        self.alerts.append(alert)
+        self._alert_lines.append(f"│ {severity_icon} {alert['description']:55} │\n")
+    
+    def _trim_alerts(self):
+        """Keep only the last 5 alerts"""
+        self.alerts = self.alerts[-5:]
+        self._alert_lines = self._alert_lines[-5:]
+    
     def _render(self):
         """Render current state to console"""
-        # Clear screen
-        self._clear_screen()
-        
-        print("=" * 70)
-        print("  PathSense - Real-Time Obstacle Detection System")
-        print("=" * 70)
-        print()
+        # Build the whole frame from the cached static stretches and the
+        # rows that change, then write it once
+        parts = [self._clear, self._upper_header]
         
         # Upper sensors
-        print("┌─ UPPER BODY SENSORS ────────────────────────────────────────┐")
-        print("│                                                              │")
-        
-        for sensor_name in ['front_high', 'front_center', 'front_low', 'left_side', 'right_side']:
+        for sensor_name in UPPER_SENSORS:
             if sensor_name in self.last_data:
                 distance = self.last_data[sensor_name]
-                self._render_sensor(sensor_name, distance)
-        
-        print("│                                                              │")
-        print("└──────────────────────────────────────────────────────────────┘")
-        print()
+                parts.append(self._render_sensor(sensor_name, distance))
+                parts.append("\n")
         
         # Ground sensor
-        print("┌─ GROUND HAZARD DETECTION ───────────────────────────────────┐")
-        print("│                                                              │")
+        parts.append(self._ground_header)
         
         if 'ground_sensor' in self.last_data:
             distance = self.last_data['ground_sensor']
-            self._render_sensor('ground_sensor', distance, is_ground=True)
+            parts.append(self._render_sensor('ground_sensor', distance, is_ground=True))
+            parts.append("\n")
         
-        print("│                                                              │")
-        print("└──────────────────────────────────────────────────────────────┘")
+        parts.append(self._ground_footer)
         
         # Recent alerts
-        if self.alerts:
-            print()
-            print("┌─ RECENT GROUND HAZARDS ─────────────────────────────────────┐")
-            for alert in self.alerts[-3:]:
-                severity_icon = "⚠️ " if alert['severity'] == 'critical' else "⚡" if alert['severity'] == 'warning' else "ℹ️ "
-                print(f"│ {severity_icon} {alert['description']:55} │")
-            print("└──────────────────────────────────────────────────────────────┘")
-        
-        print()
-        print(f"Updates: {self.update_count}  |  Press Ctrl+C to stop")
+        if self._alert_lines:
+            parts.append(self._alerts_header)
+            parts += self._alert_lines[-3:]
+            parts.append(self._alerts_footer)
+        
+        parts.append(f"\nUpdates: {self.update_count}  |  Press Ctrl+C to stop\n")
+        
+        # Clear screen and draw the frame in a single write
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def _render_sensor(self, sensor_name, distance, is_ground=False):
-        """Render individual sensor reading"""
+        """Format individual sensor reading as one frame line"""
         # Format sensor name
-        display_name = sensor_name.replace('_', ' ').title()
+        display_name = self._display_names[sensor_name]
         
         if distance is None:
             status = "NO READING"
-            bar = "─" * 20
-            color_code = ""
-        elif distance < 0.5:
-            status = "⚠️  DANGER  "
-            bar = self._create_bar(distance, 4.0, '█')
-            color_code = ""
-        elif distance < 1.5:
-            status = "⚡ WARNING "
-            bar = self._create_bar(distance, 4.0, '▓')
-            color_code = ""
-        elif distance < 3.0:
-            status = "ℹ️  ALERT   "
-            bar = self._create_bar(distance, 4.0, '▒')
-            color_code = ""
+            bar = "─" * BAR_LENGTH
         else:
-            status = "✓  CLEAR   "
-            bar = self._create_bar(distance, 4.0, '░')
-            color_code = ""
+            status, char = STATUS_TIERS[bisect_right(STATUS_BOUNDS, distance)]
+            bar = self._create_bar(distance, 4.0, char)
         
         # Format distance
         dist_str = f"{distance:5.2f}m" if distance else "  N/A  "
         
-        print(f"│ {display_name:16} {dist_str}  [{bar}] {status:12} │")
+        return f"│ {display_name:16} {dist_str}  [{bar}] {status:12} │"
     
     def _create_bar(self, value, max_value, char):
         """Create visual bar for distance"""
-        bar_length = 20
         if value is None:
-            return "─" * bar_length
+            return "─" * BAR_LENGTH
         
-        filled = int((value / max_value) * bar_length)
-        filled = min(filled, bar_length)
-        empty = bar_length - filled
+        filled = int((value / max_value) * BAR_LENGTH)
+        filled = min(max(filled, 0), BAR_LENGTH)
         
-        return f"{char * filled}{'·' * empty}"
-    
-    def _clear_screen(self):
-        """Clear console screen"""
-        # Works on Unix/Linux/Mac and Windows
-        os.system('clear' if os.name == 'posix' else 'cls')
-
+        return self._bar_lut[(char, filled)]
 
 def demo():
     """Demo visualization with PathSense"""
@@ -147,21 +203,20 @@ def demo():
         
         try:
             while True:
-                # Get sensor data
-                sensor_data = pathsense.sensor_controller.read_all_sensors()
-                
-                # Check for ground hazards
-                ground_hazard = None
-                if pathsense.ground_detector.calibrated:
-                    if 'ground_sensor' in sensor_data and sensor_data['ground_sensor']:
-                        ground_hazard = pathsense.ground_detector.detect_hazard(
-                            sensor_data['ground_sensor']
-                        )
+                # Drain what the detection loop produced since the last frame;
+                # reading the sensors here would compete with it for the pins
+                samples = []
+                while pathsense.recent_readings:
+                    samples.append(pathsense.recent_readings.popleft())
                 
                 # Update visualization
-                visualizer.update(sensor_data, ground_hazard)
+                visualizer.update_batch(samples)
                 
-                time.sleep(0.5)  # Update every 0.5 seconds for smooth display
+                # Refresh quickly while something is close, slowly on a clear path
+                distances = [visualizer.last_data.get(name) for name in UPPER_SENSORS]
+                distances = [d for d in distances if d is not None]
+                min_dist = min(distances) if distances else float('inf')
+                time.sleep(REFRESH_INTERVALS[bisect_right(REFRESH_BOUNDS, min_dist)])
                 
         except KeyboardInterrupt:
             print("\n\nStopping visualization...")
@@ -4,15 +4,45 @@ Optimization Module for Winter
 
 import time
 import math
+from bisect import bisect_right
 
 class WinterOptimizer:
     """Optimize obstacle detection for winter conditions"""
     
+    # Snow filter thresholds (meters / meters squared)
+    SNOW_VARIANCE_LIMIT = 0.4   # History variance above this looks erratic
+    SNOW_RATE_LIMIT = 0.5       # Jump between last two readings above this looks erratic
+    CONSISTENT_SPREAD = 0.2     # Readings within this spread are a solid obstacle
+    SNOW_BANK_DISTANCE = 1.0    # Side readings closer than this suggest a snow bank
+    
+    # Advisory tiers: upper temperature bounds (°C, exclusive) and messages
+    ADVISORY_BOUNDS = (-30, -20, -10, 0, 5)
+    ADVISORY_MESSAGES = (
+        "⚠️  Extreme cold: Battery life significantly reduced",
+        "❄️  Very cold: Reduced battery life, caution advised",
+        "❄️  Cold conditions: Winter optimization active",
+        "🧊 Freezing: Watch for ice patches",
+        "🌡️  Cool: Normal operation",
+        "✓ Normal temperature: All systems optimal"
+    )
+    
+    # Battery tiers: lower temperature bounds (°C, inclusive) and capacity
+    BATTERY_BOUNDS = (-20, -10, 0, 20)
+    BATTERY_CAPACITY = (
+        0.30,  # Severe impact
+        0.50,  # Significant impact
+        0.75,  # Moderate impact
+        0.95,  # Minimal impact
+        1.0    # Full capacity
+    )
+    
     def __init__(self, config):
         """Initialize winter optimizer"""
         self.config = config
         self.temperature = config.DEFAULT_TEMPERATURE  # Celsius
         self.snow_filter_enabled = config.SNOW_FILTER_ENABLED
+        self.temp_compensation_enabled = config.COLD_TEMP_COMPENSATION
+        self._compensation_factor = self._speed_factor(self.temperature)
         
         print(f"✓ Winter optimization initialized (temp: {self.temperature}°C)")
     
@@ -24,6 +54,22 @@ class WinterOptimizer:
             temperature (float): Current temperature in Celsius
         """
         self.temperature = temperature
+        self._compensation_factor = self._speed_factor(temperature)
+    
+    def _speed_factor(self, temperature):
+        """
+        Ratio of actual to standard (20°C, 343 m/s) speed of sound
+        
+        Args:
+            temperature (float): Temperature in Celsius
+            
+        Returns:
+            float: Compensation factor (1.0 when compensation is disabled)
+        """
+        if not self.temp_compensation_enabled:
+            return 1.0
+        
+        return (331.3 + (0.606 * temperature)) / 343.0
     
     def adjust_for_temperature(self, distance_reading, temperature=None):
         """
@@ -41,28 +87,14 @@ class WinterOptimizer:
         Returns:
             float: Temperature-compensated distance
         """
-        if not self.config.COLD_TEMP_COMPENSATION:
-            return distance_reading
-        
         if distance_reading is None:
             return None
         
+        # Current temperature uses the factor cached by set_temperature
         if temperature is None:
-            temperature = self.temperature
-        
-        # Standard speed of sound at 20°C
-        standard_speed = 343.0  # m/s
+            return round(distance_reading * self._compensation_factor, 2)
         
-        # Actual speed at current temperature
-        actual_speed = 331.3 + (0.606 * temperature)
-        
-        # Compensation factor
-        factor = actual_speed / standard_speed
-        
-        # Adjust distance
-        compensated_distance = distance_reading * factor
-        
-        return round(compensated_distance, 2)
+        return round(distance_reading * self._speed_factor(temperature), 2)
     
     def filter_snow_particles(self, sensor_readings, history_buffer):
         """
@@ -91,38 +123,24 @@ class WinterOptimizer:
         filtered = {}
         
         for sensor_name, current_distance in sensor_readings.items():
-            if current_distance is None:
-                filtered[sensor_name] = None
-                continue
-            
             # Get history for this sensor
-            sensor_history = history_buffer.get(sensor_name, [])
+            sensor_history = history_buffer.get(sensor_name, ())
             
-            if len(sensor_history) < 3:
-                # Not enough history, accept reading
+            if current_distance is None or len(sensor_history) < 3:
+                # No reading, or not enough history - pass through
                 filtered[sensor_name] = current_distance
                 continue
             
-            # Calculate variance in recent readings
-            variance = self._calculate_variance(sensor_history)
-            
-            # Calculate rate of change
-            if len(sensor_history) >= 2:
-                rate_of_change = abs(sensor_history[-1] - sensor_history[-2])
-            else:
-                rate_of_change = 0
-            
-            # High variance + rapid change = likely snow particles
+            # High variance or rapid change = likely snow particles
             # Low variance + slow change = likely solid obstacle
-            if variance > 0.4 or rate_of_change > 0.5:
-                # Erratic readings, likely snow particles or moving objects
-                # Require multiple consistent readings before alerting
-                if self._is_consistent_obstacle(sensor_history, current_distance):
-                    filtered[sensor_name] = current_distance
-                else:
-                    filtered[sensor_name] = None
+            # (cheap rate-of-change check first; variance only if needed)
+            erratic = (abs(sensor_history[-1] - sensor_history[-2]) > self.SNOW_RATE_LIMIT or
+                       self._calculate_variance(sensor_history) > self.SNOW_VARIANCE_LIMIT)
+            
+            # Erratic readings need multiple consistent readings before alerting
+            if erratic and not self._is_consistent_obstacle(sensor_history, current_distance):
+                filtered[sensor_name] = None
             else:
-                # Consistent readings, likely solid obstacle
                 filtered[sensor_name] = current_distance
         
         return filtered
@@ -132,7 +150,7 @@ class WinterOptimizer:
         Check if readings indicate a consistent obstacle
         
         Args:
-            history (list): Historical readings
+            history (sequence): Historical readings
             current (float): Current reading
             
         Returns:
@@ -141,19 +159,26 @@ class WinterOptimizer:
         if len(history) < 3:
             return False
         
-        # Check if last 3 readings are all within 20cm of each other
-        recent = history[-3:] + [current]
-        max_val = max(recent)
-        min_val = min(recent)
-        
-        return (max_val - min_val) < 0.2  # Within 20cm = consistent
+        # Check if last 3 readings are all within 20cm of each other,
+        # tracking the range in place and stopping as soon as it's too wide
+        min_val = max_val = current
+        for i in (-3, -2, -1):
+            reading = history[i]
+            if reading < min_val:
+                min_val = reading
+            elif reading > max_val:
+                max_val = reading
+            if (max_val - min_val) >= self.CONSISTENT_SPREAD:
+                return False
+        
+        return True  # Within 20cm = consistent
     
     def _calculate_variance(self, readings):
         """
         Calculate variance in a list of readings
         
         Args:
-            readings (list): List of distance readings
+            readings (sequence): Distance readings
             
         Returns:
             float: Variance value
@@ -161,15 +186,23 @@ class WinterOptimizer:
         if not readings or len(readings) < 2:
             return 0.0
         
-        # Remove None values
-        valid_readings = [r for r in readings if r is not None]
-        if len(valid_readings) < 2:
+        # Remove None values (history normally has none, so skip the copy)
+        if None in readings:
+            readings = [r for r in readings if r is not None]
+        
+        count = len(readings)
+        if count < 2:
             return 0.0
         
-        mean = sum(valid_readings) / len(valid_readings)
-        variance = sum((x - mean) ** 2 for x in valid_readings) / len(valid_readings)
+        mean = sum(readings) / count
+        
+        # Plain accumulation beats building a list for fsum on 5 samples
+        total = 0.0
+        for x in readings:
+            deviation = x - mean
+            total += deviation * deviation
         
-        return variance
+        return total / count
     
     def detect_snow_bank(self, side_sensors, ground_sensor):
         """
@@ -187,8 +220,11 @@ class WinterOptimizer:
         # - Elevated ground level
         # - Gradual slope
         
-        left_close = side_sensors.get('left_side', 999) < 1.0
-        right_close = side_sensors.get('right_side', 999) < 1.0
+        # Missing and failed (None) readings both count as clear
+        left = side_sensors.get('left_side')
+        right = side_sensors.get('right_side')
+        left_close = left is not None and left < self.SNOW_BANK_DISTANCE
+        right_close = right is not None and right < self.SNOW_BANK_DISTANCE
         
         if left_close or right_close:
             return {
@@ -206,20 +242,7 @@ class WinterOptimizer:
         Returns:
             str: Advisory message for user
         """
-        temp = self.temperature
-        
-        if temp < -30:
-            return "⚠️  Extreme cold: Battery life significantly reduced"
-        elif temp < -20:
-            return "❄️  Very cold: Reduced battery life, caution advised"
-        elif temp < -10:
-            return "❄️  Cold conditions: Winter optimization active"
-        elif temp < 0:
-            return "🧊 Freezing: Watch for ice patches"
-        elif temp < 5:
-            return "🌡️  Cool: Normal operation"
-        else:
-            return "✓ Normal temperature: All systems optimal"
+        return self.ADVISORY_MESSAGES[bisect_right(self.ADVISORY_BOUNDS, self.temperature)]
     
     def estimate_battery_impact(self, temperature):
         """
@@ -235,13 +258,4 @@ class WinterOptimizer:
         Returns:
             float: Capacity multiplier (0-1)
         """
-        if temperature >= 20:
-            return 1.0  # Full capacity
-        elif temperature >= 0:
-            return 0.95  # Minimal impact
-        elif temperature >= -10:
-            return 0.75  # Moderate impact
-        elif temperature >= -20:
-            return 0.50  # Significant impact
-        else:
-            return 0.30  # Severe impact
\ No newline at end of file
+        return self.BATTERY_CAPACITY[bisect_right(self.BATTERY_BOUNDS, temperature)]
\ No newline at end of file